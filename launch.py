@@ -36,6 +36,16 @@ def setup_uvicon_args(parser: argparse.ArgumentParser):
         "--reload", action="store_true", help="Enable auto-reload for development"
     )
     parser.add_argument("--workers", type=int, help="Number of worker processes")
+    parser.add_argument(
+        "--loop",
+        type=str,
+        help="Event loop implementation, one of auto/asyncio/uvloop",
+    )
+    parser.add_argument(
+        "--http",
+        type=str,
+        help="HTTP protocol implementation, one of auto/h11/httptools",
+    )
     parser.add_argument("--log_level", type=str, help="Log level")
     parser.add_argument("--access_log", action="store_true", help="Enable access log")
     parser.add_argument(
@@ -61,6 +71,9 @@ def process_uvicon_args(args):
     port = env.get_and_update_env(args, "port", 7870, int)
     reload = env.get_and_update_env(args, "reload", False, bool)
     workers = env.get_and_update_env(args, "workers", 1, int)
+    # NOTE: auto 会在安装了 uvicorn[standard] 时优先使用 uvloop + httptools
+    loop = env.get_and_update_env(args, "loop", "auto", str)
+    http = env.get_and_update_env(args, "http", "auto", str)
     log_level = env.get_and_update_env(args, "log_level", "info", str)
     access_log = env.get_and_update_env(args, "access_log", True, bool)
     proxy_headers = env.get_and_update_env(args, "proxy_headers", True, bool)
@@ -79,7 +92,10 @@ def process_uvicon_args(args):
         host=host,
         port=port,
         reload=reload,
-        workers=workers,
+        # reload 模式下只能单进程运行
+        workers=None if reload else workers,
+        loop=loop,
+        http=http,
         log_level=log_level,
         access_log=access_log,
         proxy_headers=proxy_headers,
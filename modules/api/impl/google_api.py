@@ -1,6 +1,7 @@
 from typing import Union
 
 from fastapi import HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from modules.api import utils as api_utils
@@ -146,7 +147,9 @@ async def google_text_synthesize(request: GoogleTextSynthesizeRequest):
             media_type = handler.get_media_type()
 
             base64_string = handler.enqueue_to_base64()
-            return {"audioContent": f"data:{media_type};base64,{base64_string}"}
+            return ORJSONResponse(
+                content={"audioContent": f"data:{media_type};base64,{base64_string}"}
+            )
 
         elif input.ssml:
             ssml_content = input.ssml
@@ -163,7 +166,9 @@ async def google_text_synthesize(request: GoogleTextSynthesizeRequest):
 
             base64_string = handler.enqueue_to_base64()
 
-            return {"audioContent": f"data:{media_type};base64,{base64_string}"}
+            return ORJSONResponse(
+                content={"audioContent": f"data:{media_type};base64,{base64_string}"}
+            )
 
         else:
             raise HTTPException(
@@ -3,6 +3,7 @@ from typing import List, Optional
 
 import numpy as np
 from fastapi import Body, File, Form, HTTPException, UploadFile
+from fastapi.responses import ORJSONResponse
 from numpy import clip
 from pydantic import BaseModel, Field
 from pydub import AudioSegment
@@ -232,7 +233,7 @@ openai api document:
             handler = STTHandler(input_audio=input_audio, stt_config=sst_config)
 
             result = handler.enqueue()
-            return {"text": result.text}
+            return ORJSONResponse(content={"text": result.text})
         except Exception as e:
             import logging
 
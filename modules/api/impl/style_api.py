@@ -4,7 +4,7 @@ from modules.data import styles_mgr
 
 
 async def list_styles():
-    return {"message": "ok", "data": styles_mgr.list_items()}
+    return api_utils.success_response(styles_mgr.list_items())
 
 
 async def create_style():
@@ -1,7 +1,7 @@
 import logging
 
 from fastapi import HTTPException, Query, Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 from modules.api.Api import APIManager
@@ -267,7 +267,7 @@ def setup(app: APIManager):
             if request.style:
                 XTTSV2.style = request.style
 
-            return {"message": "Settings successfully applied"}
+            return ORJSONResponse(content={"message": "Settings successfully applied"})
         except Exception as e:
             if isinstance(e, HTTPException):
                 raise e
@@ -1,6 +1,8 @@
 from typing import Any, Dict, Union
 
 import numpy as np
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from pydub import AudioSegment
 
@@ -17,8 +19,9 @@ class BaseResponse(BaseModel):
     data: Any
 
 
-def success_response(data: Any, message: str = "ok") -> BaseResponse:
-    return BaseResponse(message=message, data=data)
+def success_response(data: Any, message: str = "ok") -> ORJSONResponse:
+    # NOTE: 直接返回 Response 可以跳过 response_model 的二次校验，response_model 仅用于生成文档
+    return ORJSONResponse(content={"message": message, "data": jsonable_encoder(data)})
 
 
 def wav_to_mp3(wav_data, bitrate="48k"):
@@ -4,6 +4,7 @@ import os
 
 import dotenv
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from launch import setup_uvicon_args
 from modules.ffmpeg_env import setup_ffmpeg_path
@@ -36,6 +37,7 @@ app = FastAPI(
     title=app_title,
     description=app_description,
     version=app_version,
+    default_response_class=ORJSONResponse,
     redoc_url=None if config.runtime_env_vars.no_docs else "/redoc",
     docs_url=None if config.runtime_env_vars.no_docs else "/docs",
 )
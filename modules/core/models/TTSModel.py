@@ -56,6 +56,7 @@ class TTSModel(BaseZooModel):
         seg0 = segments[0]
         spk = seg0.spk
         spk_id = spk.id if spk else None
+        spk_hash = spk.content_hash() if spk else None
         top_P = seg0.top_p
         top_K = seg0.top_k
         temperature = seg0.temperature
@@ -71,6 +72,7 @@ class TTSModel(BaseZooModel):
         kwargs = dict(
             text="|".join(texts),
             spk_id=spk_id,
+            spk_hash=spk_hash,
             top_P=top_P,
             top_K=top_K,
             temperature=temperature,
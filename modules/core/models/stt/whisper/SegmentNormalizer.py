@@ -1,9 +1,27 @@
-import copy
-from typing import Generator, Iterable, List, NamedTuple, Optional
+import itertools
+import re
+from functools import lru_cache
+from operator import attrgetter
+from typing import Generator, Iterable, List, NamedTuple, Optional, Tuple
 
 from faster_whisper.transcribe import Segment, Word
 from whisper.utils import format_timestamp
 
+_HL_RE = re.compile(r"^(\s*)(\S.*)?$")
+_WORD_START = attrgetter("word", "start")
+
+
+@lru_cache(maxsize=4096)
+def cached_format_timestamp(
+    seconds: float, always_include_hours: bool, decimal_marker: str
+) -> str:
+    # NOTE: 同一个时间点会被相邻字幕的 start/end 重复格式化，缓存避免重复计算
+    return format_timestamp(
+        seconds=seconds,
+        always_include_hours=always_include_hours,
+        decimal_marker=decimal_marker,
+    )
+
 
 class SubtitleSegment(NamedTuple):
     start: str
@@ -32,82 +50,193 @@ class SegmentNormalizer:
         max_line_width: Optional[int] = None,
         max_line_count: Optional[int] = None,
         max_words_per_line: Optional[int] = None,
+        highlight_words: Optional[bool] = None,
     ) -> Generator[SubtitleSegment, None, None]:
         options = options or {}
+        highlight_words = highlight_words or options.get("highlight_words")
         max_line_width = max_line_width or options.get("max_line_width")
         max_line_count = max_line_count or options.get("max_line_count")
         max_words_per_line = max_words_per_line or options.get("max_words_per_line")
+
+        # NOTE: 没有任何排版参数时每个 segment 就是一条字幕，可以跳过逐词切分
+        fast_path = (
+            not highlight_words
+            and max_line_width is None
+            and max_line_count is None
+            and max_words_per_line is None
+        )
         preserve_segments = max_line_count is None or max_line_width is None
         max_line_width = max_line_width or 1000
         max_words_per_line = max_words_per_line or 1000
 
-        for subtitle in self._iterate_subtitles(
-            max_line_width, max_line_count, preserve_segments, max_words_per_line
+        if fast_path:
+            yield from self._iterate_segments(max_line_width, max_words_per_line)
+            return
+
+        for subtitle, text_parts in self._iterate_subtitles(
+            self.segments,
+            max_line_width,
+            max_line_count,
+            preserve_segments,
+            max_words_per_line,
         ):
-            subtitle_start = self._format_timestamp(subtitle[0].start)
-            subtitle_end = self._format_timestamp(subtitle[-1].end)
-            subtitle_text = "".join([word.word for word in subtitle])
-
-            yield SubtitleSegment(
-                start=subtitle_start,
-                end=subtitle_end,
-                text=subtitle_text,
-                start_s=subtitle[0].start,
-                end_s=subtitle[-1].end,
-                words=[w._asdict() for w in subtitle],
+            if highlight_words:
+                yield from self._highlight_subtitle(subtitle, text_parts)
+                continue
+
+            yield self._subtitle_to_segment(subtitle, text_parts)
+
+    def _iterate_segments(
+        self, max_line_width: int, max_words_per_line: int
+    ) -> Generator[SubtitleSegment, None, None]:
+        """
+        输出与 _iterate_subtitles 逐词切分完全一致：
+        每个 segment 一条字幕，行内还没有文字时的 word 会去掉空白 (包括首个 word)，
+        没有 words 的 segment 跳过
+        """
+        for segment in self.segments:
+            words = segment.words
+            if not words:
+                continue
+
+            subtitle: List[Word] = []
+            text_parts: List[str] = []
+            line_len = 0
+            for timing in words:
+                word = timing.word
+                if line_len == 0:
+                    word = word.strip()
+                    timing = timing._replace(word=word)
+                subtitle.append(timing)
+                text_parts.append(word)
+                line_len += len(word)
+
+            if len(words) > max_words_per_line or line_len > max_line_width:
+                # NOTE: 超长的 segment 会被换行或切分，交给通用逻辑处理
+                for subtitle, parts in self._iterate_subtitles(
+                    [segment], max_line_width, None, True, max_words_per_line
+                ):
+                    yield self._subtitle_to_segment(subtitle, parts)
+                continue
+
+            yield self._subtitle_to_segment(subtitle, text_parts)
+
+    def _subtitle_to_segment(
+        self, subtitle: List[Word], text_parts: List[str]
+    ) -> SubtitleSegment:
+        first, last = subtitle[0], subtitle[-1]
+        return self._make_segment(
+            start_s=first.start,
+            end_s=last.end,
+            text="".join(text_parts),
+            words=[w._asdict() for w in subtitle],
+        )
+
+    def _highlight_subtitle(
+        self, subtitle: List[Word], all_words: List[str]
+    ) -> Generator[SubtitleSegment, None, None]:
+        words = [w._asdict() for w in subtitle]
+        subtitle_text = "".join(all_words)
+
+        # prefixes[i] == "".join(all_words[:i]), suffixes[i] == "".join(all_words[i:])
+        prefixes = ["", *itertools.accumulate(all_words)]
+        suffixes = [""] * (len(all_words) + 1)
+        for i in range(len(all_words) - 1, -1, -1):
+            suffixes[i] = all_words[i] + suffixes[i + 1]
+
+        last = subtitle[0].start
+        for i, word in enumerate(subtitle):
+            if self._format_timestamp(last) != self._format_timestamp(word.start):
+                yield self._make_segment(
+                    start_s=last, end_s=word.start, text=subtitle_text, words=words
+                )
+
+            highlighted = _HL_RE.sub(r"\1<u>\2</u>", all_words[i])
+            yield self._make_segment(
+                start_s=word.start,
+                end_s=word.end,
+                text=prefixes[i] + highlighted + suffixes[i + 1],
+                words=words,
             )
+            last = word.end
+
+    def _make_segment(
+        self, start_s: float, end_s: float, text: str, words: list
+    ) -> SubtitleSegment:
+        return SubtitleSegment(
+            start=self._format_timestamp(start_s),
+            end=self._format_timestamp(end_s),
+            text=text,
+            start_s=start_s,
+            end_s=end_s,
+            words=words,
+        )
 
     def _iterate_subtitles(
         self,
+        segments: Iterable[Segment],
         max_line_width: int,
-        max_line_count: int,
+        max_line_count: Optional[int],
         preserve_segments: bool,
         max_words_per_line: int,
-    ):
-        line_len = 0
-        line_count = 1
+    ) -> Generator[Tuple[List[Word], List[str]], None, None]:
+        # NOTE: 热循环中的局部变量全部标注类型
+        line_len: int = 0
+        line_count: int = 1
+        chunk_index: int = 0
+        words_count: int = 0
+        n_words: int = 0
+        words: List[Word]
+        word: str
+        start: float
         subtitle: List[Word] = []
+        # NOTE: 与 subtitle 同步累积每个 word 的文本，避免 yield 时再遍历一遍 subtitle
+        text_parts: List[str] = []
         last: float = 0.0
 
-        for segment in self.segments:
+        for segment in segments:
             chunk_index = 0
-            words = segment.words
-            while chunk_index < len(words):
-                words_count = min(max_words_per_line, len(words) - chunk_index)
-                for i, original_timing in enumerate(
+            # NOTE: faster_whisper 中 words 为 Optional，没有 word 时间戳的 segment 跳过
+            words = segment.words or []
+            n_words = len(words)
+            while chunk_index < n_words:
+                words_count = min(max_words_per_line, n_words - chunk_index)
+                for i, timing in enumerate(
                     words[chunk_index : chunk_index + words_count]
                 ):
-                    timing = copy.deepcopy(original_timing)
-                    long_pause = not preserve_segments and timing.start - last > 3.0
-                    has_room = line_len + len(timing.word) <= max_line_width
+                    # NOTE: Word 是不可变的 NamedTuple，只在需要修改 word 时才 _replace 出新对象
+                    word, start = _WORD_START(timing)
+                    long_pause = not preserve_segments and start - last > 3.0
+                    has_room = line_len + len(word) <= max_line_width
                     seg_break = i == 0 and len(subtitle) > 0 and preserve_segments
 
                     if line_len > 0 and has_room and not long_pause and not seg_break:
-                        line_len += len(timing.word)
+                        line_len += len(word)
                     else:
-                        timing = timing._replace(word=timing.word.strip())
+                        word = word.strip()
                         if (
                             len(subtitle) > 0
                             and max_line_count is not None
                             and (long_pause or line_count >= max_line_count)
                             or seg_break
                         ):
-                            yield subtitle
+                            yield subtitle, text_parts
                             subtitle = []
+                            text_parts = []
                             line_count = 1
                         elif line_len > 0:
                             line_count += 1
-                            timing = timing._replace(word="\n" + timing.word)
-                        line_len = len(timing.word.strip())
+                            word = "\n" + word
+                        line_len = len(word.strip())
+                        timing = timing._replace(word=word)
                     subtitle.append(timing)
-                    last = timing.start
+                    text_parts.append(word)
+                    last = start
                 chunk_index += words_count
         if len(subtitle) > 0:
-            yield subtitle
+            yield subtitle, text_parts
 
     def _format_timestamp(self, seconds: float) -> str:
-        return format_timestamp(
-            seconds=seconds,
-            always_include_hours=self.always_include_hours,
-            decimal_marker=self.decimal_marker,
+        return cached_format_timestamp(
+            seconds, self.always_include_hours, self.decimal_marker
         )
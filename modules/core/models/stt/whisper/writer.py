@@ -1,7 +1,7 @@
 import io
-import json
-from typing import Iterable, Optional, TextIO
+from typing import BinaryIO, Iterable, Optional, TextIO
 
+import orjson
 import tqdm
 
 from modules.core.models.stt.whisper.SegmentNormalizer import (
@@ -17,8 +17,11 @@ class ResultWriter:
 
     subtitles: list[SubtitleSegment] = []
 
-    def __init__(self, output: TextIO = None):
-        self.output: TextIO = output or io.StringIO()
+    def __init__(self):
+        self.output: TextIO = self.create_output()
+
+    def create_output(self) -> TextIO:
+        return io.StringIO()
 
     def __call__(
         self, result: WhisperTranscribeResult, options: Optional[dict] = None, **kwargs
@@ -28,8 +31,9 @@ class ResultWriter:
     def write(
         self, result: WhisperTranscribeResult, options: Optional[dict] = None, **kwargs
     ):
-        self.output.seek(0)
-        self.output.truncate(0)
+        # NOTE: 每次 write 都使用新的 buffer 和 subtitles 列表，避免多次调用之间共享状态
+        self.output = self.create_output()
+        self.subtitles = []
 
         normalizer = SegmentNormalizer(
             segments=result.segments,
@@ -81,8 +85,8 @@ class WriteTXT(ResultWriter):
         options: Optional[dict] = None,
         **kwargs,
     ):
-        for segment in segments:
-            print(segment.text.strip(), file=file, flush=True)
+        parts = [f"{segment.text.strip()}\n" for segment in segments]
+        file.write("".join(parts))
 
 
 class WriteVTT(ResultWriter):
@@ -96,12 +100,13 @@ class WriteVTT(ResultWriter):
         options: Optional[dict] = None,
         **kwargs,
     ):
-        print("WEBVTT\n", file=file)
+        parts = ["WEBVTT\n\n"]
         for segment in segments:
             start = segment.start
             end = segment.end
             text = segment.text.strip()
-            print(f"{start} --> {end}\n{text}\n", file=file, flush=True)
+            parts.append(f"{start} --> {end}\n{text}\n\n")
+        file.write("".join(parts))
 
 
 class WriteSRT(ResultWriter):
@@ -116,11 +121,13 @@ class WriteSRT(ResultWriter):
         options: Optional[dict] = None,
         **kwargs,
     ):
-        for i, segment in enumerate(segments):
+        parts = []
+        for i, segment in enumerate(segments, 1):
             start = segment.start
             end = segment.end
             text = segment.text.strip()
-            print(f"{i}\n{start} --> {end}\n{text}\n", file=file, flush=True)
+            parts.append(f"{i}\n{start} --> {end}\n{text}\n\n")
+        file.write("".join(parts))
 
 
 class WriteTSV(ResultWriter):
@@ -140,40 +147,52 @@ class WriteTSV(ResultWriter):
         options: Optional[dict] = None,
         **kwargs,
     ):
-        print("start", "end", "text", sep="\t", file=file)
+        rows = ["start\tend\ttext\n"]
         for segment in segments:
             start = segment.start_s
             end = segment.end_s
             text = segment.text.strip().replace("\t", " ")
-
-            print(round(1000 * start), file=file, end="\t")
-            print(round(1000 * end), file=file, end="\t")
-            print(text, file=file, flush=True)
+            rows.append(f"{round(1000 * start)}\t{round(1000 * end)}\t{text}\n")
+        file.writelines(rows)
 
 
 class WriteJSON(ResultWriter):
     always_include_hours: bool = True
 
+    def create_output(self) -> BinaryIO:
+        # NOTE: orjson 直接输出 bytes，所以这里用 BytesIO 避免中间的 str 转换
+        return io.BytesIO()
+
     def write_result(
         self,
         segments: Iterable[SubtitleSegment],
-        file: TextIO,
+        file: BinaryIO,
         options: Optional[dict] = None,
         **kwargs,
     ):
         segments_list = []
         for segment in segments:
             segments_list.append(segment._asdict())
-        json.dump(segments_list, file, ensure_ascii=False)
+        file.write(
+            orjson.dumps(
+                segments_list,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            )
+        )
+
+    def get_result(self):
+        # NOTE: TranscribeResult.text 需要是 str，这里只在最后 decode 一次
+        return self.output.getvalue().decode("utf-8")
+
+
+_WRITERS: dict[str, type[ResultWriter]] = {
+    "txt": WriteTXT,
+    "vtt": WriteVTT,
+    "srt": WriteSRT,
+    "tsv": WriteTSV,
+    "json": WriteJSON,
+}
 
 
 def get_writer(output_format: str) -> ResultWriter:
-    writers = {
-        "txt": WriteTXT,
-        "vtt": WriteVTT,
-        "srt": WriteSRT,
-        "tsv": WriteTSV,
-        "json": WriteJSON,
-    }
-
-    return writers[output_format]()
+    return _WRITERS[output_format]()
@@ -1,10 +1,12 @@
-from typing import Dict
+import hashlib
+from typing import Dict, Optional
 
 import torch
 from cachetools import LRUCache
 from cachetools import keys as cache_keys
 
 from modules.core.spk.TTSSpeaker import TTSSpeaker
+from modules.utils.disk_cache import DiskCache
 
 
 def hash_tensor(tensor: torch.Tensor):
@@ -18,6 +20,17 @@ def hash_tensor(tensor: torch.Tensor):
 
 class InferCache:
     caches: Dict[str, LRUCache] = {}
+    # NOTE: 内存 LRU 作为 L1，disk_cache 作为多进程共享的 L2 (通过 --disk_cache_dir 开启)
+    disk_cache: Optional[DiskCache] = None
+
+    @classmethod
+    def setup_disk_cache(cls, path: str, size_limit: int):
+        InferCache.disk_cache = DiskCache(path=path, size_limit=size_limit)
+
+    @classmethod
+    def get_disk_key(cls, model_id: str, key: tuple) -> str:
+        # NOTE: hash() 在不同进程中不稳定，所以磁盘 key 使用 key 内容的 sha256
+        return hashlib.sha256(repr((model_id, key)).encode("utf-8")).hexdigest()
 
     @classmethod
     def get_cache(cls, model_id: str) -> LRUCache:
@@ -52,6 +65,12 @@ class InferCache:
         if key in cache:
             return cache[key]
 
+        if InferCache.disk_cache is not None:
+            value = InferCache.disk_cache.get(cls.get_disk_key(model_id, key))
+            if value is not None:
+                cache[key] = value
+            return value
+
         return None
 
     @classmethod
@@ -61,6 +80,9 @@ class InferCache:
 
         cache[key] = value
 
+        if InferCache.disk_cache is not None:
+            InferCache.disk_cache.set(cls.get_disk_key(model_id, key), value)
+
     @classmethod
     def cached(cls, model_id: str, should_cache: callable = None):
         """
@@ -7,6 +7,7 @@ import torch
 from modules import config
 from modules.devices import devices
 from modules.repos_static.ChatTTS import ChatTTS
+from modules.utils.torch_opt import compile_module
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +44,10 @@ def do_load_chat_tts():
     for md in all_modules:
         md.to(device=device, dtype=dtype)
 
+    # NOTE: gpt 的 compile 在 chat_tts.load 中处理，这里编译 decoder 部分
+    compile_module(chat_tts.decoder, device=device)
+    compile_module(chat_tts.dvae, device=device)
+
     # 如果 device 为 cpu 同时，又是 dtype == float16 那么报 warn
     # 提示可能无法正常运行，建议使用 float32 即开启 `--no_half` 参数
     if device == devices.cpu and dtype == torch.float16:
@@ -1,6 +1,7 @@
 import base64
 import copy
 import dataclasses
+import hashlib
 import json
 import uuid
 from tempfile import _TemporaryFileWrapper
@@ -175,6 +176,15 @@ class TTSSpeaker:
         data = json.loads(json_str)
         return data
 
+    def content_hash(self) -> str:
+        """
+        token 和 refs 的内容摘要
+
+        NOTE: 更新 speaker 的 token 时 id 不变，推理缓存需要用这个区分内容
+        """
+        data = json.dumps([self._data.token, self._data.refs], cls=DcSpkEncoder)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
     def get_token(self, model_id: str) -> Optional[DcSpkVoiceToken]:
         for token in self._data.token:
             if token.model_id == model_id:
@@ -1,13 +1,18 @@
 import argparse
 import logging
+import os
 
 from modules.core.models import zoo
-from modules.devices import devices
+from modules.core.models.tts.InerCache import InferCache
 from modules.core.models.zoo import model_zoo
+from modules.devices import devices
 from modules.utils import env
 
 logger = logging.getLogger(__name__)
 
+# NOTE: 用于把 lru_size (条目数) 换算成磁盘缓存大小，约等于 20s 24kHz float32 音频
+AVG_CACHE_ENTRY_BYTES = 2 * 1024 * 1024
+
 
 def setup_model_args(parser: argparse.ArgumentParser):
     parser.add_argument("--compile", action="store_true", help="Enable model compile")
@@ -46,6 +51,11 @@ def setup_model_args(parser: argparse.ArgumentParser):
         default=64,
         help="Set the size of the request cache pool, set it to 0 will disable lru_cache",
     )
+    parser.add_argument(
+        "--disk_cache_dir",
+        type=str,
+        help="Directory of the on-disk inference cache shared across workers, disabled by default",
+    )
     parser.add_argument(
         "--debug_generate",
         action="store_true",
@@ -60,6 +70,7 @@ def setup_model_args(parser: argparse.ArgumentParser):
 
 def process_model_args(args: argparse.Namespace):
     lru_size = env.get_and_update_env(args, "lru_size", 64, int)
+    disk_cache_dir = env.get_and_update_env(args, "disk_cache_dir", None, str)
     compile = env.get_and_update_env(args, "compile", False, bool)
     flash_attn = env.get_and_update_env(args, "flash_attn", False, bool)
     vllm = env.get_and_update_env(args, "vllm", False, bool)
@@ -77,6 +88,13 @@ def process_model_args(args: argparse.Namespace):
 
     zoo.zoo_config.debug_generate = debug_generate
 
+    if disk_cache_dir and lru_size > 0:
+        InferCache.setup_disk_cache(
+            path=os.path.join(disk_cache_dir, "infer_cache.sqlite"),
+            size_limit=lru_size * AVG_CACHE_ENTRY_BYTES,
+        )
+        logger.info(f"Disk inference cache is enabled: {disk_cache_dir}")
+
     if compile:
         logger.info("Model compile is enabled")
 
@@ -1,21 +1,59 @@
-from functools import _CacheInfo, lru_cache
-from typing import Any, Callable, TypeVar
+import threading
+from collections import OrderedDict
+from functools import _CacheInfo, lru_cache, wraps
+from typing import Any, Callable, Hashable, Optional, TypeVar
 
 from typing_extensions import ParamSpec
 
 
-def conditional_cache(maxsize: int, condition: Callable):
+def conditional_cache(
+    maxsize: Optional[int],
+    condition: Callable,
+    key: Optional[Callable[..., Hashable]] = None,
+):
+    """
+    condition 返回 True 时才使用缓存，maxsize 为 None 时不限制大小 (与 lru_cache 一致)
+
+    key 用于从参数中挑出少量字段构造缓存 key (比如 seed + hash(text))，
+    避免每次调用都对全部参数做 hash，不传时对全部参数做 hash_item
+    """
+
+    def make_key(*args, **kwargs) -> Hashable:
+        if key is not None:
+            return key(*args, **kwargs)
+        return hash_item((args, kwargs))
+
     def decorator(func):
-        @lru_cache_ext(maxsize=maxsize)
-        def cached_func(*args, **kwargs):
-            return func(*args, **kwargs)
+        cache: OrderedDict = OrderedDict()
+        lock = threading.Lock()
 
+        @wraps(func)
         def wrapper(*args, **kwargs):
-            if condition(*args, **kwargs):
-                return cached_func(*args, **kwargs)
-            else:
+            if maxsize is not None and maxsize <= 0:
+                return func(*args, **kwargs)
+            if not condition(*args, **kwargs):
                 return func(*args, **kwargs)
 
+            cache_key = make_key(*args, **kwargs)
+            with lock:
+                if cache_key in cache:
+                    cache.move_to_end(cache_key)
+                    return cache[cache_key]
+
+            result = func(*args, **kwargs)
+
+            with lock:
+                cache[cache_key] = result
+                cache.move_to_end(cache_key)
+                while maxsize is not None and len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return result
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
         return wrapper
 
     return decorator
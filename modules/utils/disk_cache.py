@@ -0,0 +1,89 @@
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional
+
+
+class DiskCache:
+    """
+    基于 sqlite 的磁盘缓存，可以在多个 worker 进程之间共享，重启之后也不会丢失
+
+    NOTE: value 使用 pickle 序列化，只用于缓存本进程写入的数据
+    """
+
+    def __init__(
+        self, path: str, size_limit: int, clock: Callable[[], float] = time.time
+    ):
+        self.path = path
+        self.size_limit = size_limit
+        # NOTE: 用于记录访问时间做 LRU 淘汰，测试中可以注入单调递增的计数器
+        self.clock = clock
+        self.local = threading.local()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._conn() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    accessed REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed)"
+            )
+
+    def _conn(self) -> sqlite3.Connection:
+        # NOTE: sqlite 连接不能跨线程使用，每个线程一个连接
+        conn: Optional[sqlite3.Connection] = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self.local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Any:
+        conn = self._conn()
+        row = conn.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        with conn:
+            conn.execute(
+                "UPDATE cache SET accessed = ? WHERE key = ?", (self.clock(), key)
+            )
+        return pickle.loads(row[0])
+
+    def set(self, key: str, value: Any):
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.size_limit:
+            return
+
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, data, len(data), self.clock()),
+            )
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection):
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()
+        if total <= self.size_limit:
+            return
+
+        expired = []
+        for key, size in conn.execute("SELECT key, size FROM cache ORDER BY accessed"):
+            if total <= self.size_limit:
+                break
+            expired.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM cache WHERE key = ?", expired)
+
+    def clear(self):
+        with self._conn() as conn:
+            conn.execute("DELETE FROM cache")
@@ -1,7 +1,32 @@
+import logging
+
 import torch
 
+from modules import config
+
+logger = logging.getLogger(__name__)
+
 
 def configure_torch_optimizations():
     torch._dynamo.config.cache_size_limit = 64
     torch._dynamo.config.suppress_errors = True
     torch.set_float32_matmul_precision("high")
+
+
+def compile_module(module: torch.nn.Module, device: torch.device) -> torch.nn.Module:
+    """
+    开启 `--compile` 时，使用 torch.compile 编译 module 的 forward (原地)
+
+    NOTE: 输入长度随请求变化，所以使用 dynamic=True 且不启用 cuda graphs，
+    与 ChatTTS gpt.prepare 的编译方式保持一致
+    """
+    if not config.runtime_env_vars.compile:
+        return module
+    if "cuda" not in str(device):
+        return module
+
+    try:
+        module.compile(backend="inductor", dynamic=True)
+    except Exception as e:
+        logger.warning(f"compile failed: {e}. fallback to normal mode.")
+    return module
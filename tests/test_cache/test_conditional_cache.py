@@ -0,0 +1,72 @@
+import pytest
+
+from modules.utils.cache import conditional_cache
+
+
+def make_cached(maxsize, condition=lambda *args, **kwargs: True, key=None):
+    calls = []
+
+    @conditional_cache(maxsize, condition, key=key)
+    def generate(text: str, seed: int = 0, options: dict = None):
+        calls.append(text)
+        return f"{text}-{seed}"
+
+    return generate, calls
+
+
+@pytest.mark.cache
+def test_conditional_cache_hit():
+    generate, calls = make_cached(4)
+
+    assert generate("a", seed=1, options={"x": [1]}) == "a-1"
+    assert generate("a", seed=1, options={"x": [1]}) == "a-1"
+    assert calls == ["a"]
+
+
+@pytest.mark.cache
+def test_conditional_cache_evicts_least_recently_used():
+    generate, calls = make_cached(2)
+
+    generate("a")
+    generate("b")
+    generate("a")
+    generate("c")  # 淘汰 b
+    generate("a")
+    generate("b")
+
+    assert calls == ["a", "b", "c", "b"]
+
+
+@pytest.mark.cache
+def test_conditional_cache_condition_bypass():
+    generate, calls = make_cached(4, condition=lambda text, seed=0, **_: seed != -1)
+
+    generate("a", seed=-1)
+    generate("a", seed=-1)
+
+    assert calls == ["a", "a"]
+
+
+@pytest.mark.cache
+def test_conditional_cache_maxsize():
+    unbounded, unbounded_calls = make_cached(None)
+    for text in ["a", "b", "c", "a", "b", "c"]:
+        unbounded(text)
+    assert unbounded_calls == ["a", "b", "c"]
+
+    disabled, disabled_calls = make_cached(0)
+    disabled("a")
+    disabled("a")
+    assert disabled_calls == ["a", "a"]
+
+
+@pytest.mark.cache
+def test_conditional_cache_custom_key_and_clear():
+    generate, calls = make_cached(4, key=lambda text, seed=0, **_: (seed, hash(text)))
+
+    generate("a", seed=1, options={"ignored": 1})
+    generate("a", seed=1, options={"ignored": 2})
+    generate.cache_clear()
+    generate("a", seed=1)
+
+    assert calls == ["a", "a"]
@@ -0,0 +1,77 @@
+import itertools
+import sqlite3
+
+import numpy as np
+import pytest
+import torch
+
+from modules.core.models.tts.InerCache import InferCache
+from modules.core.spk.TTSSpeaker import TTSSpeaker
+from modules.utils.disk_cache import DiskCache
+
+
+@pytest.fixture
+def disk_infer_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(InferCache, "caches", {})
+    monkeypatch.setattr(
+        InferCache,
+        "disk_cache",
+        DiskCache(path=str(tmp_path / "infer_cache.sqlite"), size_limit=1024 * 1024),
+    )
+    yield InferCache
+
+
+@pytest.mark.cache
+def test_infer_cache_round_trip_through_disk(disk_infer_cache, monkeypatch):
+    audio = [(24000, np.arange(16, dtype=np.float32))]
+    kwargs = dict(text="你好", spk_id="spk", seed=42)
+
+    disk_infer_cache.set_cache_val("chat-tts", audio, **kwargs)
+
+    # NOTE: 清空 L1，模拟另一个 worker 进程或者重启之后的读取
+    monkeypatch.setattr(InferCache, "caches", {})
+    cached = disk_infer_cache.get_cache_val("chat-tts", **kwargs)
+
+    assert cached is not None
+    sr, data = cached[0]
+    assert sr == 24000
+    np.testing.assert_array_equal(data, audio[0][1])
+
+
+@pytest.mark.cache
+def test_infer_cache_disk_miss(disk_infer_cache):
+    assert disk_infer_cache.get_cache_val("chat-tts", text="miss", seed=1) is None
+
+    # NOTE: miss 不能把 None 写回磁盘
+    with sqlite3.connect(disk_infer_cache.disk_cache.path) as conn:
+        (count,) = conn.execute("SELECT COUNT(*) FROM cache").fetchone()
+    assert count == 0
+
+
+@pytest.mark.cache
+def test_disk_cache_evicts_least_recently_accessed(tmp_path):
+    cache = DiskCache(
+        path=str(tmp_path / "cache.sqlite"),
+        size_limit=400,
+        clock=itertools.count().__next__,
+    )
+    cache.set("a", b"1" * 100)
+    cache.set("b", b"1" * 100)
+    cache.get("a")
+    cache.set("c", b"1" * 100)
+    cache.set("d", b"1" * 100)
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+    assert cache.get("d") is not None
+
+
+@pytest.mark.cache
+def test_speaker_content_hash_changes_with_token():
+    spk = TTSSpeaker.from_token("chat-tts", [torch.zeros(4)])
+    before = spk.content_hash()
+
+    spk.set_token(tokens=[torch.ones(4)], model_id="chat-tts")
+
+    assert spk.content_hash() != before
@@ -0,0 +1,110 @@
+import random
+
+import pytest
+from faster_whisper.transcribe import Segment, Word
+
+from modules.core.models.stt.whisper.SegmentNormalizer import SegmentNormalizer
+
+
+def make_word(start: float, end: float, word: str) -> Word:
+    return Word(start=start, end=end, word=word, probability=1.0)
+
+
+def make_segment(words: list[Word], start: float = 0.0, end: float = 0.0) -> Segment:
+    values = {field: 0 for field in Segment._fields}
+    values.update(
+        start=start,
+        end=end,
+        text="".join(w.word for w in words),
+        tokens=[],
+        words=words,
+    )
+    return Segment(**values)
+
+
+def word_level(normalizer: SegmentNormalizer, segments: list[Segment]):
+    return [
+        normalizer._subtitle_to_segment(subtitle, text_parts)
+        for subtitle, text_parts in normalizer._iterate_subtitles(
+            segments, 1000, None, True, 1000
+        )
+    ]
+
+
+def random_segments(rng: random.Random) -> list[Segment]:
+    segments = []
+    t = 0.0
+    for _ in range(rng.randint(0, 6)):
+        words = []
+        for _ in range(rng.choice([0, 1, 3, 8, 1200])):
+            text = rng.choice(
+                ["", " ", "  ", " a", "b", " loooooooong", " " + "y" * 300]
+            )
+            words.append(make_word(t, t + 0.3, text))
+            t += rng.choice([0.37, 4.0])
+        segments.append(make_segment(words, start=t - 1, end=t + 1))
+    return segments
+
+
+@pytest.mark.parametrize(
+    "words",
+    [
+        [" hello", " world"],
+        ["", " hello", " world"],
+        [" ", "  ", " hello", " world"],
+        [" " + "x" * 600, " " + "y" * 600],
+        [],
+    ],
+)
+@pytest.mark.stt
+def test_normalize_default_matches_word_level(words):
+    segments = [
+        make_segment([make_word(i, i + 0.5, w) for i, w in enumerate(words)], 0, 9)
+    ]
+    normalizer = SegmentNormalizer(
+        segments=segments, always_include_hours=True, decimal_marker=","
+    )
+
+    assert list(normalizer.normalize({})) == word_level(normalizer, segments)
+
+
+@pytest.mark.stt
+def test_normalize_default_matches_word_level_random():
+    rng = random.Random(0)
+    for _ in range(200):
+        segments = random_segments(rng)
+        normalizer = SegmentNormalizer(
+            segments=segments, always_include_hours=False, decimal_marker="."
+        )
+
+        assert list(normalizer.normalize({})) == word_level(normalizer, segments)
+
+
+@pytest.mark.stt
+def test_highlight_words():
+    words = [
+        make_word(0.0, 0.5, " hello"),
+        make_word(1.0, 1.5, " big"),
+        make_word(1.5, 2.0, " world"),
+    ]
+    normalizer = SegmentNormalizer(
+        segments=[make_segment(words, 0.0, 2.0)],
+        always_include_hours=False,
+        decimal_marker=".",
+    )
+
+    # max_line_width=12 会让 " world" 换行，得到以 "\n" 开头的 word
+    result = [
+        (s.start_s, s.end_s, s.text)
+        for s in normalizer.normalize(
+            {"highlight_words": True, "max_line_width": 12, "max_line_count": 2}
+        )
+    ]
+
+    assert result == [
+        (0.0, 0.5, "<u>hello</u> big\nworld"),
+        # 两个 word 之间的空隙输出不带高亮的完整字幕
+        (0.5, 1.0, "hello big\nworld"),
+        (1.0, 1.5, "hello <u>big</u>\nworld"),
+        (1.5, 2.0, "hello big\n<u>world</u>"),
+    ]